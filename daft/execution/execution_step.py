@@ -6,6 +6,8 @@ import sys
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Generic
 
+import pyarrow as pa
+
 if sys.version_info < (3, 8):
     from typing_extensions import Protocol
 else:
@@ -31,6 +33,16 @@ if TYPE_CHECKING:
 
 ID_GEN = itertools.count()
 
+_DEFAULT_RESOURCE_REQUEST = ResourceRequest()
+
+# PartialPartitionMetadatas are frozen, so metadata that does not depend on an instruction's inputs can be shared.
+_UNKNOWN_PARTIAL_METADATA = PartialPartitionMetadata(num_rows=None, size_bytes=None)
+_EMPTY_PARTIAL_METADATA = PartialPartitionMetadata(num_rows=0, size_bytes=0)
+_LOCAL_COUNT_PARTIAL_METADATA = PartialPartitionMetadata(
+    num_rows=1,
+    size_bytes=104,  # An empirical value, but will likely remain small.
+)
+
 
 @dataclass
 class PartitionTask(Generic[PartitionT]):
@@ -48,7 +60,7 @@ class PartitionTask(Generic[PartitionT]):
     num_results: int
     stage_id: int
     partial_metadatas: list[PartialPartitionMetadata]
-    _id: int = field(default_factory=lambda: next(ID_GEN))
+    _id: int = field(default_factory=ID_GEN.__next__)
 
     def id(self) -> str:
         return f"{self.__class__.__name__}_{self._id}"
@@ -87,17 +99,20 @@ class PartitionTask(Generic[PartitionT]):
 class PartitionTaskBuilder(Generic[PartitionT]):
     """Builds a PartitionTask by adding instructions to its pipeline."""
 
+    # A builder is created for every task the physical plan emits, so avoid a per-instance __dict__.
+    __slots__ = ("inputs", "partial_metadatas", "resource_request", "instructions", "num_results")
+
     def __init__(
         self,
         inputs: list[PartitionT],
         partial_metadatas: list[PartialPartitionMetadata] | None,
-        resource_request: ResourceRequest = ResourceRequest(),
+        resource_request: ResourceRequest = _DEFAULT_RESOURCE_REQUEST,
     ) -> None:
         self.inputs = inputs
         if partial_metadatas is not None:
             self.partial_metadatas = partial_metadatas
         else:
-            self.partial_metadatas = [PartialPartitionMetadata(num_rows=None, size_bytes=None) for _ in self.inputs]
+            self.partial_metadatas = [_UNKNOWN_PARTIAL_METADATA] * len(self.inputs)
         self.resource_request: ResourceRequest = resource_request
         self.instructions: list[Instruction] = list()
         self.num_results = len(inputs)
@@ -105,12 +120,14 @@ class PartitionTaskBuilder(Generic[PartitionT]):
     def add_instruction(
         self,
         instruction: Instruction,
-        resource_request: ResourceRequest = ResourceRequest(),
+        resource_request: ResourceRequest = _DEFAULT_RESOURCE_REQUEST,
     ) -> PartitionTaskBuilder[PartitionT]:
         """Append an instruction to this PartitionTask's pipeline."""
         self.instructions.append(instruction)
         self.partial_metadatas = instruction.run_partial_metadata(self.partial_metadatas)
-        self.resource_request = ResourceRequest.max_resources([self.resource_request, resource_request])
+        # Most instructions don't request any resources, in which case the field-wise max is a no-op.
+        if resource_request is not _DEFAULT_RESOURCE_REQUEST and resource_request != _DEFAULT_RESOURCE_REQUEST:
+            self.resource_request = ResourceRequest.max_resources([self.resource_request, resource_request])
         self.num_results = instruction.num_outputs()
         return self
 
@@ -118,16 +135,23 @@ class PartitionTaskBuilder(Generic[PartitionT]):
         """Whether this partition task is guaranteed to result in an empty partition."""
         return len(self.partial_metadatas) > 0 and all(meta.num_rows == 0 for meta in self.partial_metadatas)
 
+    def _resource_request_final_cpu(self) -> ResourceRequest:
+        """The resource request of the finalized PartitionTask, which always requests at least some CPU."""
+        # ResourceRequests are immutable, so the builder's request can be shared when it already requests CPUs.
+        if self.resource_request.num_cpus:
+            return self.resource_request
+        return ResourceRequest(
+            num_cpus=1,
+            num_gpus=self.resource_request.num_gpus,
+            memory_bytes=self.resource_request.memory_bytes,
+        )
+
     def finalize_partition_task_single_output(self, stage_id: int) -> SingleOutputPartitionTask[PartitionT]:
         """Create a SingleOutputPartitionTask from this PartitionTaskBuilder.
 
         Returns a "frozen" version of this PartitionTask that cannot have instructions added.
         """
-        resource_request_final_cpu = ResourceRequest(
-            num_cpus=self.resource_request.num_cpus or 1,
-            num_gpus=self.resource_request.num_gpus,
-            memory_bytes=self.resource_request.memory_bytes,
-        )
+        resource_request_final_cpu = self._resource_request_final_cpu()
 
         assert self.num_results == 1
 
@@ -146,11 +170,7 @@ class PartitionTaskBuilder(Generic[PartitionT]):
         Same as finalize_partition_task_single_output, except the output of this PartitionTask is a list of partitions.
         This is intended for execution steps that do a fanout.
         """
-        resource_request_final_cpu = ResourceRequest(
-            num_cpus=self.resource_request.num_cpus or 1,
-            num_gpus=self.resource_request.num_gpus,
-            memory_bytes=self.resource_request.memory_bytes,
-        )
+        resource_request_final_cpu = self._resource_request_final_cpu()
         return MultiOutputPartitionTask[PartitionT](
             inputs=self.inputs,
             stage_id=stage_id,
@@ -328,12 +348,7 @@ class EmptyScan(SingleOutputInstruction):
     def run_partial_metadata(self, input_metadatas: list[PartialPartitionMetadata]) -> list[PartialPartitionMetadata]:
         assert len(input_metadatas) == 0
 
-        return [
-            PartialPartitionMetadata(
-                num_rows=0,
-                size_bytes=0,
-            )
-        ]
+        return [_EMPTY_PARTIAL_METADATA]
 
 
 @dataclass(frozen=True)
@@ -357,12 +372,8 @@ class WriteFile(SingleOutputInstruction):
 
     def run_partial_metadata(self, input_metadatas: list[PartialPartitionMetadata]) -> list[PartialPartitionMetadata]:
         assert len(input_metadatas) == 1
-        return [
-            PartialPartitionMetadata(
-                num_rows=None,  # we can write more than 1 file per partition
-                size_bytes=None,
-            )
-        ]
+        # We can write more than 1 file per partition.
+        return [_UNKNOWN_PARTIAL_METADATA]
 
     def _handle_file_write(self, input: MicroPartition) -> MicroPartition:
         return table_io.write_tabular(
@@ -396,12 +407,8 @@ class WriteIceberg(SingleOutputInstruction):
 
     def run_partial_metadata(self, input_metadatas: list[PartialPartitionMetadata]) -> list[PartialPartitionMetadata]:
         assert len(input_metadatas) == 1
-        return [
-            PartialPartitionMetadata(
-                num_rows=None,  # we can write more than 1 file per partition
-                size_bytes=None,
-            )
-        ]
+        # We can write more than 1 file per partition.
+        return [_UNKNOWN_PARTIAL_METADATA]
 
     def _handle_file_write(self, input: MicroPartition) -> MicroPartition:
         return table_io.write_iceberg(
@@ -490,17 +497,13 @@ class LocalCount(SingleOutputInstruction):
 
     def _count(self, inputs: list[MicroPartition]) -> list[MicroPartition]:
         [input] = inputs
-        partition = MicroPartition.from_pydict({"count": [len(input)]})
+        # Build the count column from a typed Arrow array to skip Python list type inference.
+        partition = MicroPartition.from_pydict({"count": pa.array([len(input)], type=pa.int64())})
         assert partition.schema() == self.schema
         return [partition]
 
     def run_partial_metadata(self, input_metadatas: list[PartialPartitionMetadata]) -> list[PartialPartitionMetadata]:
-        return [
-            PartialPartitionMetadata(
-                num_rows=1,
-                size_bytes=104,  # An empirical value, but will likely remain small.
-            )
-        ]
+        return [_LOCAL_COUNT_PARTIAL_METADATA]
 
 
 @dataclass(frozen=True)
@@ -543,12 +546,7 @@ class MapPartition(SingleOutputInstruction):
 
     def run_partial_metadata(self, input_metadatas: list[PartialPartitionMetadata]) -> list[PartialPartitionMetadata]:
         # Can't derive anything.
-        return [
-            PartialPartitionMetadata(
-                num_rows=None,
-                size_bytes=None,
-            )
-        ]
+        return [_UNKNOWN_PARTIAL_METADATA]
 
 
 @dataclass(frozen=True)
@@ -558,6 +556,14 @@ class Sample(SingleOutputInstruction):
     with_replacement: bool = False
     seed: int | None = None
     sort_by: ExpressionsProjection | None = None
+    _null_filter: ExpressionsProjection | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # The null filter only depends on sort_by, so build it once rather than on every run.
+        if self.sort_by:
+            object.__setattr__(
+                self, "_null_filter", ExpressionsProjection([~col(e.name()).is_null() for e in self.sort_by])
+            )
 
     def run(self, inputs: list[MicroPartition]) -> list[MicroPartition]:
         return self._sample(inputs)
@@ -565,10 +571,11 @@ class Sample(SingleOutputInstruction):
     def _sample(self, inputs: list[MicroPartition]) -> list[MicroPartition]:
         [input] = inputs
         if self.sort_by:
+            assert self._null_filter is not None
             result = (
                 input.sample(self.fraction, self.size, self.with_replacement, self.seed)
                 .eval_expression_list(self.sort_by)
-                .filter(ExpressionsProjection([~col(e.name()).is_null() for e in self.sort_by]))
+                .filter(self._null_filter)
             )
         else:
             result = input.sample(self.fraction, self.size, self.with_replacement, self.seed)
@@ -576,12 +583,7 @@ class Sample(SingleOutputInstruction):
 
     def run_partial_metadata(self, input_metadatas: list[PartialPartitionMetadata]) -> list[PartialPartitionMetadata]:
         # Can't derive anything due to null filter in sample.
-        return [
-            PartialPartitionMetadata(
-                num_rows=None,
-                size_bytes=None,
-            )
-        ]
+        return [_UNKNOWN_PARTIAL_METADATA]
 
 
 @dataclass(frozen=True)
@@ -622,12 +624,7 @@ class Aggregate(SingleOutputInstruction):
 
     def run_partial_metadata(self, input_metadatas: list[PartialPartitionMetadata]) -> list[PartialPartitionMetadata]:
         # Can't derive anything.
-        return [
-            PartialPartitionMetadata(
-                num_rows=None,
-                size_bytes=None,
-            )
-        ]
+        return [_UNKNOWN_PARTIAL_METADATA]
 
 
 @dataclass(frozen=True)
@@ -662,12 +659,7 @@ class HashJoin(SingleOutputInstruction):
 
     def run_partial_metadata(self, input_metadatas: list[PartialPartitionMetadata]) -> list[PartialPartitionMetadata]:
         # Can't derive anything.
-        return [
-            PartialPartitionMetadata(
-                num_rows=None,
-                size_bytes=None,
-            )
-        ]
+        return [_UNKNOWN_PARTIAL_METADATA]
 
 
 @dataclass(frozen=True)
@@ -711,21 +703,34 @@ class ReduceInstruction(SingleOutputInstruction):
     ...
 
 
+def _sum_partial_metadatas(input_metadatas: list[PartialPartitionMetadata]) -> tuple[int | None, int | None]:
+    """Sum the rows and sizes of the input partitions in one pass; a sum is None if any of its terms is unknown."""
+    num_rows: int | None = 0
+    size_bytes: int | None = 0
+    for meta in input_metadatas:
+        if num_rows is not None:
+            num_rows = num_rows + meta.num_rows if meta.num_rows is not None else None
+        if size_bytes is not None:
+            size_bytes = size_bytes + meta.size_bytes if meta.size_bytes is not None else None
+    return num_rows, size_bytes
+
+
 @dataclass(frozen=True)
 class ReduceMerge(ReduceInstruction):
     def run(self, inputs: list[MicroPartition]) -> list[MicroPartition]:
         return self._reduce_merge(inputs)
 
     def _reduce_merge(self, inputs: list[MicroPartition]) -> list[MicroPartition]:
+        if len(inputs) == 1:
+            return inputs
         return [MicroPartition.concat(inputs)]
 
     def run_partial_metadata(self, input_metadatas: list[PartialPartitionMetadata]) -> list[PartialPartitionMetadata]:
-        input_rows = [_.num_rows for _ in input_metadatas]
-        input_sizes = [_.size_bytes for _ in input_metadatas]
+        num_rows, size_bytes = _sum_partial_metadatas(input_metadatas)
         return [
             PartialPartitionMetadata(
-                num_rows=sum(input_rows) if all(_ is not None for _ in input_rows) else None,
-                size_bytes=sum(input_sizes) if all(_ is not None for _ in input_sizes) else None,
+                num_rows=num_rows,
+                size_bytes=size_bytes,
             )
         ]
 
@@ -740,16 +745,19 @@ class ReduceMergeAndSort(ReduceInstruction):
         return self._reduce_merge_and_sort(inputs)
 
     def _reduce_merge_and_sort(self, inputs: list[MicroPartition]) -> list[MicroPartition]:
-        partition = MicroPartition.concat(inputs).sort(self.sort_by, descending=self.descending)
+        # NOTE: The inputs are range partitions fanned out of unsorted source partitions, so they are not individually
+        # sorted and a k-way merge doesn't apply. The concat is cheap since MicroPartitions are chunked, and the sort
+        # is what materializes the single output table.
+        merged = inputs[0] if len(inputs) == 1 else MicroPartition.concat(inputs)
+        partition = merged.sort(self.sort_by, descending=self.descending)
         return [partition]
 
     def run_partial_metadata(self, input_metadatas: list[PartialPartitionMetadata]) -> list[PartialPartitionMetadata]:
-        input_rows = [_.num_rows for _ in input_metadatas]
-        input_sizes = [_.size_bytes for _ in input_metadatas]
+        num_rows, size_bytes = _sum_partial_metadatas(input_metadatas)
         return [
             PartialPartitionMetadata(
-                num_rows=sum(input_rows) if all(_ is not None for _ in input_rows) else None,
-                size_bytes=sum(input_sizes) if all(_ is not None for _ in input_sizes) else None,
+                num_rows=num_rows,
+                size_bytes=size_bytes,
                 boundaries=Boundaries(list(self.sort_by), self.bounds),
             )
         ]
@@ -760,15 +768,19 @@ class ReduceToQuantiles(ReduceInstruction):
     num_quantiles: int
     sort_by: ExpressionsProjection
     descending: list[bool]
+    _sort_by_columns: ExpressionsProjection = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Skip evaluation of expressions by converting to Column Expression, since evaluation was done in Sample
+        object.__setattr__(self, "_sort_by_columns", self.sort_by.to_column_expressions())
 
     def run(self, inputs: list[MicroPartition]) -> list[MicroPartition]:
         return self._reduce_to_quantiles(inputs)
 
     def _reduce_to_quantiles(self, inputs: list[MicroPartition]) -> list[MicroPartition]:
-        merged = MicroPartition.concat(inputs)
+        merged = inputs[0] if len(inputs) == 1 else MicroPartition.concat(inputs)
 
-        # Skip evaluation of expressions by converting to Column Expression, since evaluation was done in Sample
-        merged_sorted = merged.sort(self.sort_by.to_column_expressions(), descending=self.descending)
+        merged_sorted = merged.sort(self._sort_by_columns, descending=self.descending)
 
         result = merged_sorted.quantiles(self.num_quantiles)
         return [result]
@@ -788,13 +800,7 @@ class FanoutInstruction(Instruction):
 
     def run_partial_metadata(self, input_metadatas: list[PartialPartitionMetadata]) -> list[PartialPartitionMetadata]:
         # Can't derive anything.
-        return [
-            PartialPartitionMetadata(
-                num_rows=None,
-                size_bytes=None,
-            )
-            for _ in range(self._num_outputs)
-        ]
+        return [_UNKNOWN_PARTIAL_METADATA] * self._num_outputs
 
     def num_outputs(self) -> int:
         return self._num_outputs
@@ -837,11 +843,16 @@ class FanoutRange(FanoutInstruction, Generic[PartitionT]):
         if self._num_outputs == 1:
             return [input]
 
+        # With no rows to partition, or no boundaries to partition them by, every row lands in the first output.
+        if len(input) == 0 or len(boundaries) == 0:
+            schema = input.schema()
+            return [input] + [MicroPartition.empty(schema=schema) for _ in range(self._num_outputs - 1)]
+
         table_boundaries = boundaries.to_table()
         partitioned_tables = input.partition_by_range(self.sort_by, table_boundaries, self.descending)
 
-        # Pad the partitioned_tables with empty tables if fewer than self._num_outputs were returned
-        # This can happen when all values are null or empty, which leads to an empty `boundaries` input
+        # Pad the partitioned_tables with empty tables in case partition_by_range returned fewer than
+        # self._num_outputs tables (empty inputs and boundaries are already handled above).
         assert len(partitioned_tables) >= 1, "Should have at least one returned table"
         schema = partitioned_tables[0].schema()
         partitioned_tables = partitioned_tables + [
@@ -861,12 +872,17 @@ class FanoutSlices(FanoutInstruction):
     def _multislice(self, inputs: list[MicroPartition]) -> list[MicroPartition]:
         [input] = inputs
         results = []
+        num_rows = len(input)
 
         for start, end in self.slices:
             assert start >= 0, f"start must be positive, but got {start}"
-            end = min(end, len(input))
+            end = min(end, num_rows)
 
-            results.append(input.slice(start, end))
+            if start == 0 and end == num_rows:
+                # The slice covers the entire partition, so reuse it as-is.
+                results.append(input)
+            else:
+                results.append(input.slice(start, end))
 
         return results
 
@@ -23,6 +23,7 @@ class LogicalPlanBuilder:
 
     def __init__(self, builder: _LogicalPlanBuilder) -> None:
         self._builder = builder
+        self._optimized: LogicalPlanBuilder | None = None
 
     def to_physical_plan_scheduler(self, daft_execution_config: PyDaftExecutionConfig) -> PhysicalPlanScheduler:
         """
@@ -57,9 +58,14 @@ class LogicalPlanBuilder:
     def optimize(self) -> LogicalPlanBuilder:
         """
         Optimize the underlying logical plan.
+
+        The underlying logical plan is immutable, so the optimized builder is cached and reused
+        when the same plan is executed (or explained) again.
         """
-        builder = self._builder.optimize()
-        return LogicalPlanBuilder(builder)
+        if self._optimized is None:
+            builder = self._builder.optimize()
+            self._optimized = LogicalPlanBuilder(builder)
+        return self._optimized
 
     @classmethod
     def from_in_memory_scan(
@@ -556,8 +556,9 @@ class Scheduler:
                         if not is_active():
                             break
 
-                        for task in tasks_to_dispatch:
-                            results = _build_partitions(daft_execution_config, task)
+                        for task, results in zip(
+                            tasks_to_dispatch, _build_partitions_batch(daft_execution_config, tasks_to_dispatch)
+                        ):
                             logger.debug("%s -> %s", task, results)
                             inflight_tasks[task.id()] = task
                             for result in results:
@@ -635,8 +636,32 @@ class SchedulerActor(Scheduler):
         self.reserved_cores = 1
 
 
+def _build_partitions_batch(
+    daft_execution_config_objref: ray.ObjectRef, tasks: list[PartitionTask[ray.ObjectRef]]
+) -> list[list[ray.ObjectRef]]:
+    """Run a batch of PartitionTasks and return the resulting list of partitions for each task.
+
+    Tasks in the batch that dispatch to the same remote function with the same Ray options
+    (e.g. partitions of the same stage with the same resource request) share a single configured remote.
+    """
+    configured_remotes: dict[tuple, Any] = {}
+    return [_build_partitions(daft_execution_config_objref, task, configured_remotes) for task in tasks]
+
+
+def _configure_remote(build_remote: Any, ray_options: dict[str, Any], configured_remotes: dict[tuple, Any]) -> Any:
+    """Return build_remote configured with ray_options, reusing a previously configured remote if there is one."""
+    key = (build_remote, tuple(sorted(ray_options.items())))
+    configured = configured_remotes.get(key)
+    if configured is None:
+        configured = build_remote.options(**ray_options)
+        configured_remotes[key] = configured
+    return configured
+
+
 def _build_partitions(
-    daft_execution_config_objref: ray.ObjectRef, task: PartitionTask[ray.ObjectRef]
+    daft_execution_config_objref: ray.ObjectRef,
+    task: PartitionTask[ray.ObjectRef],
+    configured_remotes: dict[tuple, Any],
 ) -> list[ray.ObjectRef]:
     """Run a PartitionTask and return the resulting list of partitions."""
     ray_options: dict[str, Any] = {"num_returns": task.num_results + 1, "name": task.name()}
@@ -650,7 +675,7 @@ def _build_partitions(
             if task.instructions and isinstance(task.instructions[-1], FanoutInstruction)
             else reduce_pipeline
         )
-        build_remote = build_remote.options(**ray_options)
+        build_remote = _configure_remote(build_remote, ray_options, configured_remotes)
         [metadatas_ref, *partitions] = build_remote.remote(daft_execution_config_objref, task.instructions, task.inputs)
 
     else:
@@ -661,7 +686,7 @@ def _build_partitions(
         )
         if task.instructions and isinstance(task.instructions[0], ScanWithTask):
             ray_options["scheduling_strategy"] = "SPREAD"
-        build_remote = build_remote.options(**ray_options)
+        build_remote = _configure_remote(build_remote, ray_options, configured_remotes)
         [metadatas_ref, *partitions] = build_remote.remote(
             daft_execution_config_objref, task.instructions, *task.inputs
         )
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
+import copy
 import datetime
-import itertools
 
 import numpy as np
 import pandas as pd
@@ -16,6 +16,7 @@ from daft.table import MicroPartition
 from daft.utils import pyarrow_supports_fixed_shape_tensor
 
 ARROW_VERSION = tuple(int(s) for s in pa.__version__.split(".") if s.isnumeric())
+PANDAS_VERSION = tuple(int(s) for s in pd.__version__.split(".") if s.isnumeric())
 
 PYTHON_TYPE_ARRAYS = {
     "int": [1, 2],
@@ -79,62 +80,6 @@ ROUNDTRIP_TYPES = {
 }
 
 
-ARROW_TYPE_ARRAYS = {
-    "int8": pa.array(PYTHON_TYPE_ARRAYS["int"], pa.int8()),
-    "int16": pa.array(PYTHON_TYPE_ARRAYS["int"], pa.int16()),
-    "int32": pa.array(PYTHON_TYPE_ARRAYS["int"], pa.int32()),
-    "int64": pa.array(PYTHON_TYPE_ARRAYS["int"], pa.int64()),
-    "uint8": pa.array(PYTHON_TYPE_ARRAYS["int"], pa.uint8()),
-    "uint16": pa.array(PYTHON_TYPE_ARRAYS["int"], pa.uint16()),
-    "uint32": pa.array(PYTHON_TYPE_ARRAYS["int"], pa.uint32()),
-    "uint64": pa.array(PYTHON_TYPE_ARRAYS["int"], pa.uint64()),
-    "float32": pa.array(PYTHON_TYPE_ARRAYS["float"], pa.float32()),
-    "float64": pa.array(PYTHON_TYPE_ARRAYS["float"], pa.float64()),
-    "string": pa.array(PYTHON_TYPE_ARRAYS["str"], pa.string()),
-    "binary": pa.array(PYTHON_TYPE_ARRAYS["binary"], pa.binary()),
-    "boolean": pa.array(PYTHON_TYPE_ARRAYS["bool"], pa.bool_()),
-    "date32": pa.array(PYTHON_TYPE_ARRAYS["date"], pa.date32()),
-    "date64": pa.array(PYTHON_TYPE_ARRAYS["date"], pa.date64()),
-    "time64_microseconds": pa.array(PYTHON_TYPE_ARRAYS["time"], pa.time64("us")),
-    "time64_nanoseconds": pa.array(PYTHON_TYPE_ARRAYS["time"], pa.time64("ns")),
-    "list": pa.array(PYTHON_TYPE_ARRAYS["list"], pa.list_(pa.int64())),
-    "fixed_size_list": pa.array([[1, 2], [3, 4]], pa.list_(pa.int64(), 2)),
-    "map": pa.array(
-        [[(1.0, 1), (2.0, 2)], [(3.0, 3), (4.0, 4)]],
-        pa.map_(pa.float32(), pa.int32()),
-    ),
-    "struct": pa.array(PYTHON_TYPE_ARRAYS["struct"], pa.struct([("a", pa.int64()), ("b", pa.float64())])),
-    "empty_struct": pa.array(PYTHON_TYPE_ARRAYS["empty_struct"], pa.struct([])),
-    "nested_struct": pa.array(
-        PYTHON_TYPE_ARRAYS["nested_struct"],
-        pa.struct(
-            {
-                "a": pa.struct([("b", pa.int64())]),
-                "c": pa.struct([]),
-            }
-        ),
-    ),
-    "null": pa.array(PYTHON_TYPE_ARRAYS["null"], pa.null()),
-    "tensor": pa.ExtensionArray.from_storage(
-        ROUNDTRIP_TYPES["tensor"],
-        pa.array(
-            [
-                {"data": PYTHON_TYPE_ARRAYS["tensor"][0].ravel(), "shape": [2, 2]},
-                {"data": PYTHON_TYPE_ARRAYS["tensor"][1].ravel(), "shape": [3, 3]},
-            ],
-            pa.struct(
-                {
-                    "data": pa.large_list(pa.field("item", pa.int64())),
-                    "shape": pa.large_list(pa.field("item", pa.uint64())),
-                }
-            ),
-        ),
-    ),
-    # The following types are not natively supported and will be cast to Python object types.
-    "timestamp": pa.array(PYTHON_TYPE_ARRAYS["timestamp"]),
-}
-
-
 ARROW_ROUNDTRIP_TYPES = {
     "int8": pa.int8(),
     "int16": pa.int16(),
@@ -173,146 +118,318 @@ if pyarrow_supports_fixed_shape_tensor():
     # PYTHON_INFERRED_TYPES["canonical_tensor"] = DataType.tensor(DataType.int64(), (2, 2))
     # ROUNDTRIP_TYPES["canonical_tensor"] = arrow_tensor_dtype
     ARROW_ROUNDTRIP_TYPES["canonical_tensor"] = arrow_tensor_dtype
-    ARROW_TYPE_ARRAYS["canonical_tensor"] = pa.FixedShapeTensorArray.from_numpy_ndarray(np.arange(8).reshape(2, 2, 2))
 
+ROUNDTRIP_SCHEMA = pa.schema(ROUNDTRIP_TYPES)
+ARROW_ROUNDTRIP_SCHEMA = pa.schema(ARROW_ROUNDTRIP_TYPES)
+
+
+# (start, end) slices for the sliced roundtrip tests: the full array, a leading slice, an offset slice that stops
+# short of the end, and a trailing slice. Further (start, end) combinations exercise the same offset/length
+# handling, so they only multiply the size of the test grid.
+SLICES = [(0, 4), (0, 2), (1, 3), (2, 4)]
+
+
+@pytest.fixture(scope="session")
+def arrow_type_arrays() -> dict[str, pa.Array]:
+    # Built once, on first use, so that collecting this module doesn't allocate the roundtrip arrays.
+    arrays = {
+        "int8": pa.array(PYTHON_TYPE_ARRAYS["int"], pa.int8()),
+        "int16": pa.array(PYTHON_TYPE_ARRAYS["int"], pa.int16()),
+        "int32": pa.array(PYTHON_TYPE_ARRAYS["int"], pa.int32()),
+        "int64": pa.array(PYTHON_TYPE_ARRAYS["int"], pa.int64()),
+        "uint8": pa.array(PYTHON_TYPE_ARRAYS["int"], pa.uint8()),
+        "uint16": pa.array(PYTHON_TYPE_ARRAYS["int"], pa.uint16()),
+        "uint32": pa.array(PYTHON_TYPE_ARRAYS["int"], pa.uint32()),
+        "uint64": pa.array(PYTHON_TYPE_ARRAYS["int"], pa.uint64()),
+        "float32": pa.array(PYTHON_TYPE_ARRAYS["float"], pa.float32()),
+        "float64": pa.array(PYTHON_TYPE_ARRAYS["float"], pa.float64()),
+        "string": pa.array(PYTHON_TYPE_ARRAYS["str"], pa.string()),
+        "binary": pa.array(PYTHON_TYPE_ARRAYS["binary"], pa.binary()),
+        "boolean": pa.array(PYTHON_TYPE_ARRAYS["bool"], pa.bool_()),
+        "date32": pa.array(PYTHON_TYPE_ARRAYS["date"], pa.date32()),
+        "date64": pa.array(PYTHON_TYPE_ARRAYS["date"], pa.date64()),
+        "time64_microseconds": pa.array(PYTHON_TYPE_ARRAYS["time"], pa.time64("us")),
+        "time64_nanoseconds": pa.array(PYTHON_TYPE_ARRAYS["time"], pa.time64("ns")),
+        "list": pa.array(PYTHON_TYPE_ARRAYS["list"], pa.list_(pa.int64())),
+        "fixed_size_list": pa.array([[1, 2], [3, 4]], pa.list_(pa.int64(), 2)),
+        "map": pa.array(
+            [[(1.0, 1), (2.0, 2)], [(3.0, 3), (4.0, 4)]],
+            pa.map_(pa.float32(), pa.int32()),
+        ),
+        "struct": pa.array(PYTHON_TYPE_ARRAYS["struct"], pa.struct([("a", pa.int64()), ("b", pa.float64())])),
+        "empty_struct": pa.array(PYTHON_TYPE_ARRAYS["empty_struct"], pa.struct([])),
+        "nested_struct": pa.array(
+            PYTHON_TYPE_ARRAYS["nested_struct"],
+            pa.struct(
+                {
+                    "a": pa.struct([("b", pa.int64())]),
+                    "c": pa.struct([]),
+                }
+            ),
+        ),
+        "null": pa.array(PYTHON_TYPE_ARRAYS["null"], pa.null()),
+        "tensor": pa.ExtensionArray.from_storage(
+            ROUNDTRIP_TYPES["tensor"],
+            pa.array(
+                [
+                    {"data": PYTHON_TYPE_ARRAYS["tensor"][0].ravel(), "shape": [2, 2]},
+                    {"data": PYTHON_TYPE_ARRAYS["tensor"][1].ravel(), "shape": [3, 3]},
+                ],
+                pa.struct(
+                    {
+                        "data": pa.large_list(pa.field("item", pa.int64())),
+                        "shape": pa.large_list(pa.field("item", pa.uint64())),
+                    }
+                ),
+            ),
+        ),
+        # The following types are not natively supported and will be cast to Python object types.
+        "timestamp": pa.array(PYTHON_TYPE_ARRAYS["timestamp"]),
+    }
+    if pyarrow_supports_fixed_shape_tensor():
+        arrays["canonical_tensor"] = pa.FixedShapeTensorArray.from_numpy_ndarray(np.arange(8).reshape(2, 2, 2))
+    return arrays
 
-def _with_uuid_ext_type(uuid_ext_type) -> tuple[dict, dict]:
-    if get_context().runner_config.name == "ray":
-        # pyarrow extension types aren't supported in Ray clusters yet.
-        return ARROW_ROUNDTRIP_TYPES, ARROW_TYPE_ARRAYS
-    arrow_roundtrip_types = ARROW_ROUNDTRIP_TYPES.copy()
-    arrow_type_arrays = ARROW_TYPE_ARRAYS.copy()
-    arrow_roundtrip_types["ext_type"] = uuid_ext_type
-    storage = ARROW_TYPE_ARRAYS["binary"]
-    arrow_type_arrays["ext_type"] = pa.ExtensionArray.from_storage(uuid_ext_type, storage)
-    return arrow_roundtrip_types, arrow_type_arrays
 
+@pytest.fixture(scope="session")
+def expected_arrow_roundtrip_table(arrow_type_arrays) -> pa.Table:
+    return pa.table(arrow_type_arrays).cast(ARROW_ROUNDTRIP_SCHEMA)
 
-def test_from_pydict_roundtrip() -> None:
-    table = MicroPartition.from_pydict(PYTHON_TYPE_ARRAYS)
-    assert len(table) == 2
-    assert set(table.column_names()) == set(PYTHON_TYPE_ARRAYS.keys())
-    for field in table.schema():
-        assert field.dtype == PYTHON_INFERRED_TYPES[field.name]
-    schema = pa.schema(ROUNDTRIP_TYPES)
+
+@pytest.fixture(scope="session")
+def expected_pydict_roundtrip_table(arrow_type_arrays) -> pa.Table:
     arrs = {}
     for col_name, col in PYTHON_TYPE_ARRAYS.items():
         if col_name == "tensor":
-            arrs[col_name] = ARROW_TYPE_ARRAYS[col_name]
+            arrs[col_name] = arrow_type_arrays[col_name]
         else:
-            arrs[col_name] = pa.array(col, type=schema.field(col_name).type)
-    expected_table = pa.table(arrs, schema=schema)
-    assert table.to_arrow() == expected_table
+            arrs[col_name] = pa.array(col, type=ROUNDTRIP_SCHEMA.field(col_name).type)
+    return pa.table(arrs, schema=ROUNDTRIP_SCHEMA)
 
 
-def test_from_pydict_arrow_roundtrip(uuid_ext_type) -> None:
-    arrow_roundtrip_types, arrow_type_arrays = _with_uuid_ext_type(uuid_ext_type)
-    table = MicroPartition.from_pydict(arrow_type_arrays)
+def _with_uuid_ext_type(uuid_ext_type, arrow_type_arrays) -> dict:
+    if get_context().runner_config.name == "ray":
+        # pyarrow extension types aren't supported in Ray clusters yet.
+        return arrow_type_arrays
+    arrow_type_arrays = arrow_type_arrays.copy()
+    storage = arrow_type_arrays["binary"]
+    arrow_type_arrays["ext_type"] = pa.ExtensionArray.from_storage(uuid_ext_type, storage)
+    return arrow_type_arrays
+
+
+def _xfail_nested_empty_struct(col_names: list[str]) -> list:
+    # On their own, nested_struct columns take the Arrow record batch path, which only rewrites top-level empty
+    # structs and so fails on the nested empty struct field. The whole-table tests go through the Python-object
+    # path instead because of their tensor column.
+    return [
+        pytest.param(
+            col_name,
+            marks=pytest.mark.xfail(reason="Empty structs nested in a struct column aren't supported from Arrow"),
+        )
+        if col_name == "nested_struct"
+        else col_name
+        for col_name in col_names
+    ]
+
+
+def _check_from_pydict_roundtrip(data: dict, expected_pydict_table: pa.Table) -> None:
+    table = MicroPartition.from_pydict(data)
     assert len(table) == 2
-    assert set(table.column_names()) == set(arrow_type_arrays.keys())
+    assert table.column_names() == list(data.keys())
     for field in table.schema():
-        assert field.dtype == (
-            DataType.from_arrow_type(arrow_type_arrays[field.name].type)
-            if (field.name != "empty_struct" and field.name != "nested_struct")
-            else PYTHON_INFERRED_TYPES[field.name]  # empty structs are internally represented as {"": None}
-        )
-    expected_table = pa.table(arrow_type_arrays).cast(pa.schema(arrow_roundtrip_types))
-    assert table.to_arrow() == expected_table
+        assert field.dtype == PYTHON_INFERRED_TYPES[field.name]
+    assert table.to_arrow() == expected_pydict_table.select(list(data.keys()))
+
 
+def test_from_pydict_roundtrip(expected_pydict_roundtrip_table) -> None:
+    _check_from_pydict_roundtrip(PYTHON_TYPE_ARRAYS, expected_pydict_roundtrip_table)
 
-def test_from_arrow_roundtrip(uuid_ext_type) -> None:
-    arrow_roundtrip_types, arrow_type_arrays = _with_uuid_ext_type(uuid_ext_type)
-    pa_table = pa.table(arrow_type_arrays)
-    table = MicroPartition.from_arrow(pa_table)
+
+@pytest.mark.parametrize("col_name", list(PYTHON_TYPE_ARRAYS))
+def test_from_pydict_roundtrip_single_column(col_name, expected_pydict_roundtrip_table) -> None:
+    _check_from_pydict_roundtrip({col_name: PYTHON_TYPE_ARRAYS[col_name]}, expected_pydict_roundtrip_table)
+
+
+def _check_from_arrow_roundtrip(table: MicroPartition, arrow_type_arrays: dict, expected_arrow_table: pa.Table) -> None:
     assert len(table) == 2
-    assert set(table.column_names()) == set(arrow_type_arrays.keys())
+    assert table.column_names() == list(arrow_type_arrays.keys())
     for field in table.schema():
         assert field.dtype == (
             DataType.from_arrow_type(arrow_type_arrays[field.name].type)
             if (field.name != "empty_struct" and field.name != "nested_struct")
             else PYTHON_INFERRED_TYPES[field.name]  # empty structs are internally represented as {"": None}
         )
-    expected_table = pa.table(arrow_type_arrays).cast(pa.schema(arrow_roundtrip_types))
+    # The extension type is registered per test, so its column isn't part of the cached expected table; it
+    # roundtrips as-is.
+    expected_table = pa.table(
+        {
+            col_name: expected_arrow_table[col_name] if col_name in ARROW_ROUNDTRIP_TYPES else arr
+            for col_name, arr in arrow_type_arrays.items()
+        }
+    )
     assert table.to_arrow() == expected_table
 
 
-def test_from_pandas_roundtrip() -> None:
-    df = pd.DataFrame(PYTHON_TYPE_ARRAYS)
+def _single_arrow_column(col_name: str, uuid_ext_type, arrow_type_arrays: dict) -> dict:
+    arrow_type_arrays = _with_uuid_ext_type(uuid_ext_type, arrow_type_arrays)
+    if col_name not in arrow_type_arrays:
+        pytest.skip(f"{col_name} is not supported with the current runner")
+    return {col_name: arrow_type_arrays[col_name]}
+
+
+def test_from_pydict_arrow_roundtrip(uuid_ext_type, arrow_type_arrays, expected_arrow_roundtrip_table) -> None:
+    arrow_type_arrays = _with_uuid_ext_type(uuid_ext_type, arrow_type_arrays)
+    table = MicroPartition.from_pydict(arrow_type_arrays)
+    _check_from_arrow_roundtrip(table, arrow_type_arrays, expected_arrow_roundtrip_table)
+
+
+@pytest.mark.parametrize("col_name", [*ARROW_ROUNDTRIP_TYPES, "ext_type"])
+def test_from_pydict_arrow_roundtrip_single_column(
+    col_name, uuid_ext_type, arrow_type_arrays, expected_arrow_roundtrip_table
+) -> None:
+    arrow_type_arrays = _single_arrow_column(col_name, uuid_ext_type, arrow_type_arrays)
+    table = MicroPartition.from_pydict(arrow_type_arrays)
+    _check_from_arrow_roundtrip(table, arrow_type_arrays, expected_arrow_roundtrip_table)
+
+
+def test_from_arrow_roundtrip(uuid_ext_type, arrow_type_arrays, expected_arrow_roundtrip_table) -> None:
+    arrow_type_arrays = _with_uuid_ext_type(uuid_ext_type, arrow_type_arrays)
+    table = MicroPartition.from_arrow(pa.table(arrow_type_arrays))
+    _check_from_arrow_roundtrip(table, arrow_type_arrays, expected_arrow_roundtrip_table)
+
+
+@pytest.mark.parametrize("col_name", _xfail_nested_empty_struct([*ARROW_ROUNDTRIP_TYPES, "ext_type"]))
+def test_from_arrow_roundtrip_single_column(
+    col_name, uuid_ext_type, arrow_type_arrays, expected_arrow_roundtrip_table
+) -> None:
+    arrow_type_arrays = _single_arrow_column(col_name, uuid_ext_type, arrow_type_arrays)
+    table = MicroPartition.from_arrow(pa.table(arrow_type_arrays))
+    _check_from_arrow_roundtrip(table, arrow_type_arrays, expected_arrow_roundtrip_table)
+
+
+def _check_from_pandas_roundtrip(data: dict) -> None:
+    # The struct fix-ups below write through to the dicts held by object columns, so don't share them with data.
+    df = pd.DataFrame(copy.deepcopy(data))
     table = MicroPartition.from_pandas(df)
     assert len(table) == 2
-    assert set(table.column_names()) == set(PYTHON_TYPE_ARRAYS.keys())
+    assert table.column_names() == list(data.keys())
     for field in table.schema():
         assert field.dtype == PANDAS_INFERRED_TYPES[field.name]
     # pyarrow --> pandas will insert explicit Nones within the struct fields.
-    df["struct"][1]["a"] = None
-    df["empty_struct"][0] = {}
-    df["empty_struct"][1] = {}
-    df["nested_struct"][0]["c"] = {}
-    df["nested_struct"][1]["c"] = {}
+    if "struct" in df:
+        df["struct"][1]["a"] = None
+    if "empty_struct" in df:
+        df["empty_struct"][0] = {}
+        df["empty_struct"][1] = {}
+    if "nested_struct" in df:
+        df["nested_struct"][0]["c"] = {}
+        df["nested_struct"][1]["c"] = {}
     pd.testing.assert_frame_equal(table.to_pandas(), df)
 
 
-def test_from_pydict_list() -> None:
-    daft_table = MicroPartition.from_pydict({"a": [1, 2, 3]})
-    assert "a" in daft_table.column_names()
-    assert daft_table.to_arrow()["a"].combine_chunks() == pa.array([1, 2, 3], type=pa.int64())
+def test_from_pandas_roundtrip() -> None:
+    _check_from_pandas_roundtrip(PYTHON_TYPE_ARRAYS)
 
 
-def test_from_pydict_np() -> None:
-    daft_table = MicroPartition.from_pydict({"a": np.array([1, 2, 3], dtype=np.int64)})
-    assert "a" in daft_table.column_names()
-    assert daft_table.to_arrow()["a"].combine_chunks() == pa.array([1, 2, 3], type=pa.int64())
+@pytest.mark.parametrize("col_name", _xfail_nested_empty_struct(list(PYTHON_TYPE_ARRAYS)))
+def test_from_pandas_roundtrip_single_column(col_name) -> None:
+    _check_from_pandas_roundtrip({col_name: PYTHON_TYPE_ARRAYS[col_name]})
 
 
-def test_from_pydict_arrow() -> None:
-    daft_table = MicroPartition.from_pydict({"a": pa.array([1, 2, 3], type=pa.int8())})
-    assert "a" in daft_table.column_names()
-    assert daft_table.to_arrow()["a"].combine_chunks() == pa.array([1, 2, 3], type=pa.int8())
+@pytest.mark.skipif(
+    PANDAS_VERSION < (2, 0, 0),
+    reason=f"Pandas version {PANDAS_VERSION} doesn't support pyarrow-backed dtypes.",
+)
+def test_from_pandas_pyarrow_backed_roundtrip() -> None:
+    arrow_types = {
+        "int": pa.int64(),
+        "float": pa.float64(),
+        "bool": pa.bool_(),
+        "str": pa.string(),
+        "timestamp": pa.timestamp("ns"),
+    }
+    data = {col_name: PYTHON_TYPE_ARRAYS[col_name] for col_name in arrow_types}
+    df = pd.DataFrame(data).astype({col_name: pd.ArrowDtype(dtype) for col_name, dtype in arrow_types.items()})
+    table = MicroPartition.from_pandas(df)
+    assert len(table) == 2
+    assert table.column_names() == list(data.keys())
+    for field in table.schema():
+        assert field.dtype == PANDAS_INFERRED_TYPES[field.name]
+    # Daft converts back to NumPy-backed dtypes, so this should match the NumPy-backed DataFrame.
+    pd.testing.assert_frame_equal(table.to_pandas(), pd.DataFrame(data))
 
 
-@pytest.mark.parametrize("list_type", [pa.list_, pa.large_list])
-def test_from_pydict_arrow_list_array(list_type) -> None:
-    arrow_arr = pa.array([["a", "b"], ["c"], None, [None, "d", "e"]], list_type(pa.string()))
-    daft_table = MicroPartition.from_pydict({"a": arrow_arr})
+@pytest.mark.parametrize(
+    "data,expected_type",
+    [
+        ([1, 2, 3], pa.int64()),
+        (np.array([1, 2, 3], dtype=np.int64), pa.int64()),
+        (pa.array([1, 2, 3], type=pa.int8()), pa.int8()),
+        (Series.from_arrow(pa.array([1, 2, 3], type=pa.int8())), pa.int8()),
+    ],
+    ids=["list", "np", "arrow", "series"],
+)
+def test_from_pydict_column_types(data, expected_type) -> None:
+    daft_table = MicroPartition.from_pydict({"a": data})
     assert "a" in daft_table.column_names()
-    # Perform expected Daft cast, where the outer list array is cast to a large list array
-    # (if the outer list array wasn't already a large list in the first place), and
-    # the inner string array is cast to a large string array.
-    expected = arrow_arr.cast(pa.large_list(pa.large_string()))
-    assert daft_table.to_arrow()["a"].combine_chunks() == expected
+    assert daft_table.to_arrow()["a"].combine_chunks() == pa.array([1, 2, 3], type=expected_type)
 
 
-def test_from_pydict_arrow_fixed_size_list_array() -> None:
-    data = [["a", "b"], ["c", "d"], None, [None, "e"]]
-    arrow_arr = pa.array(data, pa.list_(pa.string(), 2))
-    daft_table = MicroPartition.from_pydict({"a": arrow_arr})
-    assert "a" in daft_table.column_names()
-    # Perform expected Daft cast, where the inner string array is cast to a large string array.
-    expected = pa.array(data, type=pa.list_(pa.large_string(), 2))
-    assert daft_table.to_arrow()["a"].combine_chunks() == expected
+# Nested Arrow arrays and the arrays Daft is expected to return for them: every list array is cast to a large list
+# array (if it wasn't already one), while fixed-size lists and maps keep their outer type, and every string array is
+# cast to a large string array.
+NESTED_ARROW_DATA = [
+    (
+        pa.array([["a", "b"], ["c"], None, [None, "d", "e"]], pa.list_(pa.string())),
+        pa.array([["a", "b"], ["c"], None, [None, "d", "e"]], pa.large_list(pa.large_string())),
+    ),
+    (
+        pa.array([["a", "b"], ["c"], None, [None, "d", "e"]], pa.large_list(pa.string())),
+        pa.array([["a", "b"], ["c"], None, [None, "d", "e"]], pa.large_list(pa.large_string())),
+    ),
+    (
+        pa.array([["a", "b"], ["c", "d"], None, [None, "e"]], pa.list_(pa.string(), 2)),
+        pa.array([["a", "b"], ["c", "d"], None, [None, "e"]], pa.list_(pa.large_string(), 2)),
+    ),
+    (
+        pa.array([[(1, 2.0), (3, 4.0)], None, [(5, 6.0), (7, 8.0)]], pa.map_(pa.int64(), pa.float64())),
+        pa.array([[(1, 2.0), (3, 4.0)], None, [(5, 6.0), (7, 8.0)]], pa.map_(pa.int64(), pa.float64())),
+    ),
+    (
+        pa.array([[(1.0, 1), (2.0, 2)], [(3.0, 3), (4.0, 4)]], pa.map_(pa.float32(), pa.int32())),
+        pa.array([[(1.0, 1), (2.0, 2)], [(3.0, 3), (4.0, 4)]], pa.map_(pa.float32(), pa.int32())),
+    ),
+    (
+        pa.array([{"a": "foo", "b": "bar"}, {"b": "baz", "c": "quux"}]),
+        pa.array(
+            [{"a": "foo", "b": "bar"}, {"b": "baz", "c": "quux"}],
+            type=pa.struct([("a", pa.large_string()), ("b", pa.large_string()), ("c", pa.large_string())]),
+        ),
+    ),
+    # A struct of lists of struct of lists of strings.
+    (
+        pa.array([{"a": [{"b": ["foo", "bar"]}]}, {"a": [{"b": ["baz", "quux"]}]}]),
+        pa.array(
+            [{"a": [{"b": ["foo", "bar"]}]}, {"a": [{"b": ["baz", "quux"]}]}],
+            type=pa.struct(
+                [("a", pa.large_list(pa.field("item", pa.struct([("b", pa.large_list(pa.large_string()))]))))]
+            ),
+        ),
+    ),
+]
+NESTED_ARROW_IDS = ["list", "large_list", "fixed_size_list", "map", "map_float_keys", "struct", "deeply_nested"]
 
 
-def test_from_pydict_arrow_map_array() -> None:
-    data = [[(1, 2.0), (3, 4.0)], None, [(5, 6.0), (7, 8.0)]]
-    arrow_arr = pa.array(data, pa.map_(pa.int64(), pa.float64()))
-    daft_table = MicroPartition.from_pydict({"a": arrow_arr})
+def _check_nested_arrow_roundtrip(daft_table: MicroPartition, arrow_arr: pa.Array, expected: pa.Array) -> None:
     assert "a" in daft_table.column_names()
-    # Perform expected Daft cast, where the inner string and int arrays are cast to large string and int arrays.
-    expected = arrow_arr.cast(pa.map_(pa.int64(), pa.float64()))
     assert daft_table.to_arrow()["a"].combine_chunks() == expected
-    assert daft_table.to_pydict()["a"] == data
+    if pa.types.is_map(arrow_arr.type):
+        assert daft_table.to_pydict()["a"] == arrow_arr.to_pylist()
 
 
-def test_from_pydict_arrow_struct_array() -> None:
-    data = [{"a": "foo", "b": "bar"}, {"b": "baz", "c": "quux"}]
-    arrow_arr = pa.array(data)
-    daft_table = MicroPartition.from_pydict({"a": arrow_arr})
-    assert "a" in daft_table.column_names()
-    # Perform expected Daft cast, where the inner string array is cast to a large string array.
-    expected = pa.array(
-        data, type=pa.struct([("a", pa.large_string()), ("b", pa.large_string()), ("c", pa.large_string())])
-    )
-    assert daft_table.to_arrow()["a"].combine_chunks() == expected
+@pytest.mark.parametrize("arrow_arr,expected", NESTED_ARROW_DATA, ids=NESTED_ARROW_IDS)
+def test_from_pydict_arrow_nested(arrow_arr, expected) -> None:
+    _check_nested_arrow_roundtrip(MicroPartition.from_pydict({"a": arrow_arr}), arrow_arr, expected)
 
 
 @pytest.mark.skipif(
@@ -333,21 +450,6 @@ def test_from_pydict_arrow_extension_array(uuid_ext_type) -> None:
     assert result.to_pylist() == arrow_arr.to_pylist()
 
 
-def test_from_pydict_arrow_deeply_nested() -> None:
-    # Test a struct of lists of struct of lists of strings.
-    data = [{"a": [{"b": ["foo", "bar"]}]}, {"a": [{"b": ["baz", "quux"]}]}]
-    arrow_arr = pa.array(data)
-    daft_table = MicroPartition.from_pydict({"a": arrow_arr})
-    assert "a" in daft_table.column_names()
-    # Perform the expected Daft cast, where each list array is cast to a large list array and
-    # the string array is cast to a large string array.
-    expected = pa.array(
-        data,
-        type=pa.struct([("a", pa.large_list(pa.field("item", pa.struct([("b", pa.large_list(pa.large_string()))]))))]),
-    )
-    assert daft_table.to_arrow()["a"].combine_chunks() == expected
-
-
 @pytest.mark.parametrize(
     "data,out_dtype",
     [
@@ -377,146 +479,80 @@ def test_from_pydict_arrow_with_nulls_roundtrip(data, out_dtype, chunked) -> Non
     assert daft_table.to_arrow()["a"].combine_chunks() == pac.cast(data, out_dtype)
 
 
-@pytest.mark.parametrize(
-    "data,out_dtype",
-    [
-        # Full data.
-        (pa.array([1, 2, 3, 4], type=pa.int64()), pa.int64()),
-        (pa.array(["a", "b", "c", "d"], type=pa.string()), pa.large_string()),
-        (pa.array([b"a", b"b", b"c", b"d"], type=pa.binary()), pa.large_binary()),
-        (pa.array([[1, 2], [3], [4, 5, 6], [None, 7]], pa.list_(pa.int64())), pa.large_list(pa.int64())),
-        (pa.array([[1, 2], [3, None], [4, 5], [None, 6]], pa.list_(pa.int64(), 2)), pa.list_(pa.int64(), 2)),
-        (
-            pa.array([{"a": 1, "b": 2}, {"b": 3, "c": 4}, {"a": 5}, {"a": 6, "c": 7}]),
-            pa.struct([("a", pa.int64()), ("b", pa.int64()), ("c", pa.int64())]),
-        ),
-        (
-            pa.array([[(1, 2), (3, 4)], [(5, 6)], [(7, 8)]], pa.map_(pa.int64(), pa.int64())),
-            pa.map_(pa.int64(), pa.int64()),
-        ),
-        # Contains nulls.
-        (pa.array([1, 2, None, 4], type=pa.int64()), pa.int64()),
-        (pa.array(["a", "b", None, "d"], type=pa.string()), pa.large_string()),
-        (pa.array([b"a", b"b", None, b"d"], type=pa.binary()), pa.large_binary()),
-        (pa.array([[1, 2], [3], None, [None, 4]], pa.list_(pa.int64())), pa.large_list(pa.int64())),
-        (pa.array([[1, 2], [3, 4], None, [None, 6]], pa.list_(pa.int64(), 2)), pa.list_(pa.int64(), 2)),
-        (
-            pa.array([{"a": 1, "b": 2}, {"b": 3, "c": 4}, None, {"a": 5, "c": 6}]),
-            pa.struct([("a", pa.int64()), ("b", pa.int64()), ("c", pa.int64())]),
-        ),
-        (
-            pa.array([[(1, 2), (3, 4)], None, [(7, 8)]], pa.map_(pa.int64(), pa.int64())),
-            pa.map_(pa.int64(), pa.int64()),
-        ),
-    ],
-)
-@pytest.mark.parametrize("chunked", [False, True])
-@pytest.mark.parametrize("slice_", list(itertools.combinations(range(4), 2)))
-def test_from_pydict_arrow_sliced_roundtrip(data, out_dtype, chunked, slice_) -> None:
-    offset, end = slice_
-    length = end - offset
-    sliced_data = data.slice(offset, length)
-    if chunked:
-        sliced_data = pa.chunked_array(sliced_data)
-    daft_table = MicroPartition.from_pydict({"a": sliced_data})
-    assert "a" in daft_table.column_names()
-    if chunked:
-        sliced_data = sliced_data.combine_chunks()
-    assert daft_table.to_arrow()["a"].combine_chunks() == pac.cast(sliced_data, out_dtype)
+SLICED_ROUNDTRIP_DATA = [
+    # Full data.
+    (pa.array([1, 2, 3, 4], type=pa.int64()), pa.int64()),
+    (pa.array(["a", "b", "c", "d"], type=pa.string()), pa.large_string()),
+    (pa.array([b"a", b"b", b"c", b"d"], type=pa.binary()), pa.large_binary()),
+    (pa.array([[1, 2], [3], [4, 5, 6], [None, 7]], pa.list_(pa.int64())), pa.large_list(pa.int64())),
+    (pa.array([[1, 2], [3, None], [4, 5], [None, 6]], pa.list_(pa.int64(), 2)), pa.list_(pa.int64(), 2)),
+    (
+        pa.array([{"a": 1, "b": 2}, {"b": 3, "c": 4}, {"a": 5}, {"a": 6, "c": 7}]),
+        pa.struct([("a", pa.int64()), ("b", pa.int64()), ("c", pa.int64())]),
+    ),
+    (
+        pa.array([[(1, 2), (3, 4)], [(5, 6)], [(7, 8)]], pa.map_(pa.int64(), pa.int64())),
+        pa.map_(pa.int64(), pa.int64()),
+    ),
+    # Contains nulls.
+    (pa.array([1, 2, None, 4], type=pa.int64()), pa.int64()),
+    (pa.array(["a", "b", None, "d"], type=pa.string()), pa.large_string()),
+    (pa.array([b"a", b"b", None, b"d"], type=pa.binary()), pa.large_binary()),
+    (pa.array([[1, 2], [3], None, [None, 4]], pa.list_(pa.int64())), pa.large_list(pa.int64())),
+    (pa.array([[1, 2], [3, 4], None, [None, 6]], pa.list_(pa.int64(), 2)), pa.list_(pa.int64(), 2)),
+    (
+        pa.array([{"a": 1, "b": 2}, {"b": 3, "c": 4}, None, {"a": 5, "c": 6}]),
+        pa.struct([("a", pa.int64()), ("b", pa.int64()), ("c", pa.int64())]),
+    ),
+    (
+        pa.array([[(1, 2), (3, 4)], None, [(7, 8)]], pa.map_(pa.int64(), pa.int64())),
+        pa.map_(pa.int64(), pa.int64()),
+    ),
+]
 
 
-def test_from_pydict_series() -> None:
-    daft_table = MicroPartition.from_pydict({"a": Series.from_arrow(pa.array([1, 2, 3], type=pa.int8()))})
-    assert "a" in daft_table.column_names()
-    assert daft_table.to_arrow()["a"].combine_chunks() == pa.array([1, 2, 3], type=pa.int8())
+@pytest.fixture(scope="module")
+def sliced_arrays() -> dict[tuple[int, tuple[int, int]], pa.Array]:
+    # Keyed by (index into SLICED_ROUNDTRIP_DATA, slice).
+    return {
+        (data_idx, (start, end)): data.slice(start, end - start)
+        for data_idx, (data, _) in enumerate(SLICED_ROUNDTRIP_DATA)
+        for start, end in SLICES
+    }
 
 
-@pytest.mark.parametrize(
-    "data,out_dtype",
-    [
-        # Full data.
-        (pa.array([1, 2, 3, 4], type=pa.int64()), pa.int64()),
-        (pa.array(["a", "b", "c", "d"], type=pa.string()), pa.large_string()),
-        (pa.array([b"a", b"b", b"c", b"d"], type=pa.binary()), pa.large_binary()),
-        (pa.array([[1, 2], [3], [4, 5, 6], [None, 7]], pa.list_(pa.int64())), pa.large_list(pa.int64())),
-        (pa.array([[1, 2], [3, None], [4, 5], [None, 6]], pa.list_(pa.int64(), 2)), pa.list_(pa.int64(), 2)),
-        (
-            pa.array([{"a": 1, "b": 2}, {"b": 3, "c": 4}, {"a": 5}, {"a": 6, "c": 7}]),
-            pa.struct([("a", pa.int64()), ("b", pa.int64()), ("c", pa.int64())]),
-        ),
-        (
-            pa.array([[(1, 2), (3, 4)], [(5, 6)], [(7, 8)]], pa.map_(pa.int64(), pa.int64())),
-            pa.map_(pa.int64(), pa.int64()),
-        ),
-        # Contains nulls.
-        (pa.array([1, 2, None, 4], type=pa.int64()), pa.int64()),
-        (pa.array(["a", "b", None, "d"], type=pa.string()), pa.large_string()),
-        (pa.array([b"a", b"b", None, b"d"], type=pa.binary()), pa.large_binary()),
-        (pa.array([[1, 2], [3], None, [None, 4]], pa.list_(pa.int64())), pa.large_list(pa.int64())),
-        (pa.array([[1, 2], [3, 4], None, [None, 6]], pa.list_(pa.int64(), 2)), pa.list_(pa.int64(), 2)),
-        (
-            pa.array([{"a": 1, "b": 2}, {"b": 3, "c": 4}, None, {"a": 5, "c": 6}]),
-            pa.struct([("a", pa.int64()), ("b", pa.int64()), ("c", pa.int64())]),
-        ),
-        (
-            pa.array([[(1, 2), (3, 4)], None, [(7, 8)]], pa.map_(pa.int64(), pa.int64())),
-            pa.map_(pa.int64(), pa.int64()),
-        ),
-    ],
-)
-@pytest.mark.parametrize("slice_", list(itertools.combinations(range(4), 2)))
-def test_from_arrow_sliced_roundtrip(data, out_dtype, slice_) -> None:
-    offset, end = slice_
-    length = end - offset
-    sliced_data = data.slice(offset, length)
-    daft_table = MicroPartition.from_arrow(pa.table({"a": sliced_data}))
-    assert "a" in daft_table.column_names()
-    assert daft_table.to_arrow()["a"].combine_chunks() == pac.cast(sliced_data, out_dtype)
+@pytest.fixture(scope="module")
+def expected_sliced_arrays(sliced_arrays) -> dict[tuple[int, tuple[int, int]], pa.Array]:
+    # Keyed like sliced_arrays.
+    return {
+        (data_idx, slice_): pac.cast(sliced_arrays[data_idx, slice_], out_dtype)
+        for data_idx, (_, out_dtype) in enumerate(SLICED_ROUNDTRIP_DATA)
+        for slice_ in SLICES
+    }
 
 
-@pytest.mark.parametrize("list_type", [pa.list_, pa.large_list])
-def test_from_arrow_list_array(list_type) -> None:
-    arrow_arr = pa.array([["a", "b"], ["c"], None, [None, "d", "e"]], list_type(pa.string()))
-    daft_table = MicroPartition.from_arrow(pa.table({"a": arrow_arr}))
+@pytest.mark.parametrize("data_idx", range(len(SLICED_ROUNDTRIP_DATA)))
+@pytest.mark.parametrize("chunked", [False, True])
+@pytest.mark.parametrize("slice_", SLICES)
+def test_from_pydict_arrow_sliced_roundtrip(data_idx, chunked, slice_, sliced_arrays, expected_sliced_arrays) -> None:
+    sliced_data = sliced_arrays[data_idx, slice_]
+    daft_table = MicroPartition.from_pydict({"a": pa.chunked_array(sliced_data) if chunked else sliced_data})
     assert "a" in daft_table.column_names()
-    # Perform expected Daft cast, where the outer list array is cast to a large list array
-    # (if the outer list array wasn't already a large list in the first place), and
-    # the inner string array is cast to a large string array.
-    expected = arrow_arr.cast(pa.large_list(pa.large_string()))
-    assert daft_table.to_arrow()["a"].combine_chunks() == expected
+    assert daft_table.to_arrow()["a"].combine_chunks() == expected_sliced_arrays[data_idx, slice_]
 
 
-def test_from_arrow_fixed_size_list_array() -> None:
-    data = [["a", "b"], ["c", "d"], None, [None, "e"]]
-    arrow_arr = pa.array(data, pa.list_(pa.string(), 2))
-    daft_table = MicroPartition.from_arrow(pa.table({"a": arrow_arr}))
+@pytest.mark.parametrize("data_idx", range(len(SLICED_ROUNDTRIP_DATA)))
+@pytest.mark.parametrize("slice_", SLICES)
+def test_from_arrow_sliced_roundtrip(data_idx, slice_, sliced_arrays, expected_sliced_arrays) -> None:
+    sliced_data = sliced_arrays[data_idx, slice_]
+    daft_table = MicroPartition.from_arrow(pa.table({"a": sliced_data}))
     assert "a" in daft_table.column_names()
-    # Perform expected Daft cast, where the inner string array is cast to a large string array.
-    expected = pa.array(data, type=pa.list_(pa.large_string(), 2))
-    assert daft_table.to_arrow()["a"].combine_chunks() == expected
+    assert daft_table.to_arrow()["a"].combine_chunks() == expected_sliced_arrays[data_idx, slice_]
 
 
-def test_from_arrow_struct_array() -> None:
-    data = [{"a": "foo", "b": "bar"}, {"b": "baz", "c": "quux"}]
-    arrow_arr = pa.array(data)
-    daft_table = MicroPartition.from_arrow(pa.table({"a": arrow_arr}))
-    assert "a" in daft_table.column_names()
-    # Perform expected Daft cast, where the inner string array is cast to a large string array.
-    expected = pa.array(
-        data, type=pa.struct([("a", pa.large_string()), ("b", pa.large_string()), ("c", pa.large_string())])
-    )
-    assert daft_table.to_arrow()["a"].combine_chunks() == expected
-
-
-def test_from_arrow_map_array() -> None:
-    data = [[(1.0, 1), (2.0, 2)], [(3.0, 3), (4.0, 4)]]
-    arrow_arr = pa.array(data, pa.map_(pa.float32(), pa.int32()))
-    daft_table = MicroPartition.from_arrow(pa.table({"a": arrow_arr}))
-    assert "a" in daft_table.column_names()
-    # Perform expected Daft cast, where the inner string and int arrays are cast to large string and int arrays.
-    expected = arrow_arr.cast(pa.map_(pa.float32(), pa.int32()))
-    assert daft_table.to_arrow()["a"].combine_chunks() == expected
-    assert daft_table.to_pydict()["a"] == data
+@pytest.mark.parametrize("arrow_arr,expected", NESTED_ARROW_DATA, ids=NESTED_ARROW_IDS)
+def test_from_arrow_nested(arrow_arr, expected) -> None:
+    _check_nested_arrow_roundtrip(MicroPartition.from_arrow(pa.table({"a": arrow_arr})), arrow_arr, expected)
 
 
 @pytest.mark.skipif(
@@ -537,31 +573,6 @@ def test_from_arrow_extension_array(uuid_ext_type) -> None:
     assert result.to_pylist() == arrow_arr.to_pylist()
 
 
-def test_from_arrow_deeply_nested() -> None:
-    # Test a struct of lists of struct of lists of strings.
-    data = [{"a": [{"b": ["foo", "bar"]}]}, {"a": [{"b": ["baz", "quux"]}]}]
-    arrow_arr = pa.array(data)
-    daft_table = MicroPartition.from_arrow(pa.table({"a": arrow_arr}))
-    assert "a" in daft_table.column_names()
-    # Perform the expected Daft cast, where each list array is cast to a large list array and
-    # the string array is cast to a large string array.
-    expected = pa.array(
-        data,
-        type=pa.struct(
-            [
-                (
-                    "a",
-                    pa.large_list(
-                        pa.field("item", pa.struct([("b", pa.large_list(pa.field("item", pa.large_string())))]))
-                    ),
-                )
-            ]
-        ),
-    )
-
-    assert daft_table.to_arrow()["a"].combine_chunks() == expected
-
-
 def test_from_pydict_bad_input() -> None:
     with pytest.raises(ValueError, match="Mismatch in Series lengths"):
         MicroPartition.from_pydict({"a": [1, 2, 3, 4], "b": [5, 6, 7]})